@@ -35,9 +35,9 @@ FileContent = bytes
 FileContentEncrypted = str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FileUploadModel:
-    input_uuid: str = field(default_factory=lambda: str(uuid.uuid4()))
+    input_uuid: str = field(default_factory=lambda: uuid.uuid4().hex)
     file_name: FileName | None = None
     file_type: FileType | None = None
     file_content_encrypted: FileContentEncrypted | None = None
@@ -131,13 +131,11 @@ class FileUploadVisitor(FormSpecVisitor[FileUpload, FileUploadModel]):
 
     @classmethod
     def encrypt_content(cls, content: bytes) -> str:
-        return base64.b64encode(
-            Encrypter.encrypt(base64.b64encode(content).decode("ascii"))
-        ).decode("ascii")
+        return base64.b64encode(Encrypter.encrypt(content)).decode("ascii")
 
     @classmethod
     def decrypt_content(cls, content: str) -> bytes:
-        return base64.b64decode(Encrypter.decrypt(base64.b64decode(content)))
+        return Encrypter.decrypt_bytes(base64.b64decode(content))
 
     def _to_vue(
         self, raw_value: object, parsed_value: FileUploadModel | EmptyValue
@@ -8,7 +8,7 @@ import os
 from flask import session
 
 from cmk.crypto.secrets import Secret
-from cmk.crypto.symmetric import aes_gcm_decrypt, aes_gcm_encrypt, TaggedCiphertext
+from cmk.crypto.symmetric import aes_gcm_decrypt_bytes, aes_gcm_encrypt, TaggedCiphertext
 
 
 class Encrypter:
@@ -30,7 +30,7 @@ class Encrypter:
         return Secret.from_b64(session.session_info.encrypter_secret)
 
     @staticmethod
-    def encrypt(value: str) -> bytes:
+    def encrypt(value: str | bytes) -> bytes:
         salt = os.urandom(Encrypter.SALT_LENGTH)
         nonce = os.urandom(Encrypter.NONCE_LENGTH)
         key = Encrypter._get_secret().hmac(salt)
@@ -39,8 +39,12 @@ class Encrypter:
 
     @staticmethod
     def decrypt(raw: bytes) -> str:
+        return Encrypter.decrypt_bytes(raw).decode("utf-8")
+
+    @staticmethod
+    def decrypt_bytes(raw: bytes) -> bytes:
         salt, rest = raw[: Encrypter.SALT_LENGTH], raw[Encrypter.SALT_LENGTH :]
         nonce, rest = rest[: Encrypter.NONCE_LENGTH], rest[Encrypter.NONCE_LENGTH :]
         tag, encrypted = rest[: TaggedCiphertext.TAG_LENGTH], rest[TaggedCiphertext.TAG_LENGTH :]
         key = Encrypter._get_secret().hmac(salt)
-        return aes_gcm_decrypt(key, nonce, TaggedCiphertext(ciphertext=encrypted, tag=tag))
+        return aes_gcm_decrypt_bytes(key, nonce, TaggedCiphertext(ciphertext=encrypted, tag=tag))
@@ -263,14 +263,30 @@ def save_updated_host_label_files(updated_host_labels: list[UpdatedHostLabelsEnt
 
 def get_updated_host_label_files(newer_than: float) -> list[UpdatedHostLabelsEntry]:
     """Returns the host label file content + meta data which are newer than the given timestamp"""
-    updated_host_labels = []
-    for path in sorted(cmk.utils.paths.discovered_host_labels_dir.glob("*.mk")):
-        mtime = path.stat().st_mtime
-        if path.stat().st_mtime <= newer_than:
-            continue  # Already known to central site
+    labels_dir = cmk.utils.paths.discovered_host_labels_dir
+    try:
+        entries = os.scandir(labels_dir)
+    except FileNotFoundError:
+        return []
+
+    updated_files = []
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".mk"):
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+            except FileNotFoundError:
+                continue  # Removed in the meantime, e.g. together with its host
+            if mtime <= newer_than:
+                continue  # Already known to central site
+            updated_files.append((entry.name, mtime))
+    updated_files.sort()
 
-        with path.open() as f:
-            updated_host_labels.append((path.name, mtime, f.read()))
+    updated_host_labels = []
+    for file_name, mtime in updated_files:
+        with (labels_dir / file_name).open() as f:
+            updated_host_labels.append((file_name, mtime, f.read()))
     return updated_host_labels
 
 
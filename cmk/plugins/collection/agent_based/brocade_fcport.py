@@ -27,7 +27,7 @@ from cmk.agent_based.v2 import (
 )
 from cmk.plugins.lib.brocade import (
     brocade_fcport_getitem,
-    brocade_fcport_inventory_this_port,
+    brocade_fcport_inventory_predicate,
     DETECT,
     DISCOVERY_DEFAULT_PARAMETERS,
 )
@@ -326,16 +326,12 @@ snmp_section_brocade_fcport = SNMPSection(
 
 
 def discover_brocade_fcport(params: Mapping[str, Any], section: Section) -> DiscoveryResult:
+    inventory_this_port = brocade_fcport_inventory_predicate(params)
     for if_entry in section:
         admstate = if_entry["admstate"]
         phystate = if_entry["phystate"]
         opstate = if_entry["opstate"]
-        if brocade_fcport_inventory_this_port(
-            admstate=admstate,
-            phystate=phystate,
-            opstate=opstate,
-            settings=params,
-        ):
+        if inventory_this_port(admstate, phystate, opstate):
             yield Service(
                 item=brocade_fcport_getitem(
                     number_of_ports=len(section),
@@ -20,7 +20,7 @@ from cmk.agent_based.v2 import (
 )
 from cmk.plugins.lib.brocade import (
     brocade_fcport_getitem,
-    brocade_fcport_inventory_this_port,
+    brocade_fcport_inventory_predicate,
     DETECT,
     DISCOVERY_DEFAULT_PARAMETERS,
 )
@@ -119,13 +119,9 @@ snmp_section_brocade_sfp = SNMPSection(
 
 def discover_brocade_sfp(params: Mapping[str, Any], section: Section) -> DiscoveryResult:
     number_of_ports = len(section)
+    inventory_this_port = brocade_fcport_inventory_predicate(params)
     for port_index, port_info in section.items():
-        if brocade_fcport_inventory_this_port(
-            admstate=port_info["admstate"],
-            phystate=port_info["phystate"],
-            opstate=port_info["opstate"],
-            settings=params,
-        ):
+        if inventory_this_port(port_info["admstate"], port_info["phystate"], port_info["opstate"]):
             yield Service(
                 item=brocade_fcport_getitem(
                     number_of_ports=number_of_ports,
@@ -23,6 +23,7 @@
 import time
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from enum import Enum
+from functools import cache
 from typing import Any, Final, NamedTuple
 
 from cmk.agent_based.v2 import (
@@ -84,6 +85,9 @@ MAX_COMMAND_TIMEOUTS_PER_HOUR = 100
 
 CRC_ERRORS_ID: Final = 199
 
+# Characters to drop from NVMe values, e.g. "1,234,567 [632 GB]" or "100%"
+_NVME_VALUE_STRIP_TABLE: Final = str.maketrans("", "", "%.,")
+
 ATA_ID_TO_DISK_ATTRIBUTE: Final[Mapping[int, DiskAttribute]] = {
     5: DiskAttribute.REALLOCATED_SECTORS,
     9: DiskAttribute.POWER_ON_HOURS,
@@ -98,6 +102,25 @@ ATA_ID_TO_DISK_ATTRIBUTE: Final[Mapping[int, DiskAttribute]] = {
     CRC_ERRORS_ID: DiskAttribute.CRC_ERRORS,
 }
 
+# Flattened for the parse function, which only needs the names
+_ATA_ID_TO_NAME: Final[Mapping[int, str]] = {
+    ata_id: attribute.name for ata_id, attribute in ATA_ID_TO_DISK_ATTRIBUTE.items()
+}
+_REALLOCATED_EVENTS_ID: Final = next(
+    ata_id
+    for ata_id, attribute in ATA_ID_TO_DISK_ATTRIBUTE.items()
+    if attribute is DiskAttribute.REALLOCATED_EVENTS
+)
+
+# The temperature is currently handled in a separate check plug-in "smart.temp".
+# Resolve the remaining members once, rather than iterating the enum on every check.
+_CHECKED_ATTRIBUTES: Final = tuple(
+    attribute for attribute in DiskAttribute if attribute is not DiskAttribute.TEMPERATURE
+)
+_CAPTURED_ON_DISCOVERY: Final = tuple(
+    attribute.name for attribute in DiskAttribute if attribute.capture_on_discovery
+)
+
 
 def _set_int_or_zero(disk: Disk, key: str, value: Any) -> None:
     try:
@@ -155,65 +178,69 @@ def parse_raw_values(string_table: StringTable) -> Section:
                   'Temperature': 40}}
 
     """
-    ata_lines = (line for line in string_table if len(line) >= 13)
-    nvme_lines = (line for line in string_table if 3 <= len(line) <= 6)
-
-    return {**_parse_ata_lines(ata_lines), **_parse_nvme_lines(nvme_lines)}
-
-
-def _parse_ata_lines(ata_lines: Iterable[Sequence[str]]) -> Section:
-    ata_disks: dict[str, Disk] = {}
-
-    for (
-        disk_path,
-        _disk_type,
-        _disk_name,
-        ID,
-        attribute_name,
-        _flag,
-        value,
-        _worst,
-        threshold,
-        _type,
-        _updated,
-        _when_failed,
-        raw_value,
-        *_raw_value_info,
-    ) in ata_lines:
-        disk = ata_disks.setdefault(disk_path, {})
-
-        if attribute_name == "Unknown_Attribute":
+    ata_lines: list[Sequence[str]] = []
+    nvme_lines: list[Sequence[str]] = []
+    for line in string_table:
+        if (length := len(line)) >= 13:
+            ata_lines.append(line)
+        elif 3 <= length <= 6:
+            nvme_lines.append(line)
+
+    disks = _parse_ata_lines(ata_lines)
+    disks.update(_parse_nvme_lines(nvme_lines))
+    return disks
+
+
+def _parse_ata_lines(ata_lines: Iterable[Sequence[str]]) -> Disks:
+    ata_disks: Disks = {}
+    disk_path: str | None = None
+    disk: Disk = {}
+
+    for line in ata_lines:
+        # Only index the columns we need instead of unpacking the whole line.
+        # The lines of a disk come in one block, so only look up the disk if the path changes.
+        if line[0] != disk_path:
+            disk_path = line[0]
+            disk = ata_disks.setdefault(disk_path, {})
+
+        if (attribute_name := line[4]) == "Unknown_Attribute":
             continue
 
-        if int(ID) == CRC_ERRORS_ID and attribute_name == "UDMA_CRC_Error_Count":
+        attribute_id = int(line[3])
+        try:
+            raw_value = int(line[12])
+        except ValueError:
+            raw_value = 0
+
+        if attribute_id == CRC_ERRORS_ID and attribute_name == "UDMA_CRC_Error_Count":
             # UDMA_CRC_Error_Count and CRC_Error_Count share the same attribute ID (199).
             # Since we explicitly distinguish between the two, we choose "UDMA_CRC_Error_Count"
             # whenever the ID 199 comes with this textual information.
             # Otherwise, we default to CRC_Error_Count.
-            _set_int_or_zero(disk, DiskAttribute.UDMA_CRC_ERRORS.name, raw_value)
+            disk[DiskAttribute.UDMA_CRC_ERRORS.name] = raw_value
             continue
 
-        if (lookup_attribute := ATA_ID_TO_DISK_ATTRIBUTE.get(int(ID))) is None:
+        if (lookup_name := _ATA_ID_TO_NAME.get(attribute_id)) is None:
             if attribute_name in disk:
                 # Don't override already set attributes
                 continue
-            _set_int_or_zero(disk, attribute_name, raw_value)
+            disk[attribute_name] = raw_value
             continue
 
-        _set_int_or_zero(disk, lookup_attribute.name, raw_value)
+        disk[lookup_name] = raw_value
 
-        if lookup_attribute is DiskAttribute.REALLOCATED_EVENTS:
+        if attribute_id == _REALLOCATED_EVENTS_ID:
             # special case, see check function
             try:
-                disk["_normalized_value_Reallocated_Events"] = int(value)
-                disk["_normalized_threshold_Reallocated_Events"] = int(threshold)
+                disk["_normalized_value_Reallocated_Events"] = int(line[6])
+                disk["_normalized_threshold_Reallocated_Events"] = int(line[8])
             except ValueError:
                 pass
 
     return ata_disks
 
 
-def _parse_nvme_lines(nvme_lines: Iterable[Sequence[str]]) -> Section:
+def _parse_nvme_lines(nvme_lines: Iterable[Sequence[str]]) -> Disks:
     nvme_disks: Disks = {}
 
     for line in nvme_lines:
@@ -221,9 +248,9 @@ def _parse_nvme_lines(nvme_lines: Iterable[Sequence[str]]) -> Section:
             disk = nvme_disks.setdefault(line[0], {})
             continue
 
-        field, value = (e.strip() for e in " ".join(line).split(":"))
+        field, value = (e.strip() for e in " ".join(line).split(":", 1))
         key = field.replace(" ", "_")
-        value = value.replace("%", "").replace(".", "").replace(",", "")
+        value = value.translate(_NVME_VALUE_STRIP_TABLE)
         match field:
             case "Temperature":
                 _set_int_or_zero(disk, key, value.split()[0])
@@ -252,9 +279,7 @@ def discover_smart_stats(section: Section) -> DiscoveryResult:
         if not disk or (len(disk) == 1 and DiskAttribute.TEMPERATURE.name in disk):
             continue
 
-        captured = {
-            f.name: disk[f.name] for f in DiskAttribute if f.capture_on_discovery and f.name in disk
-        }
+        captured = {name: disk[name] for name in _CAPTURED_ON_DISCOVERY if name in disk}
 
         yield Service(item=disk_name, parameters=captured)
 
@@ -264,17 +289,13 @@ def check_smart_stats(item: str, params: Mapping[str, int], section: Section) ->
     if (disk := section.get(item)) is None:
         return
 
-    for attribute in DiskAttribute:
+    for attribute in _CHECKED_ATTRIBUTES:
         if (value := disk.get(attribute.name)) is None:
             continue
 
         ref_value = params.get(attribute.name)
 
         match (attribute, ref_value):
-            case (DiskAttribute.TEMPERATURE, _):
-                # Currently handled in a separate check plug-in "smart.temp"
-                continue
-
             case (DiskAttribute.AVAILABLE_SPARE, _):
                 # AVAILABLE_SPARE uses another ref value
                 yield from _check_available_spare(disk, value)
@@ -408,17 +429,19 @@ def _default_check_results(
     )
 
 
+_DISPLAY_NAME_OVERRIDES: Final[Mapping[DiskAttribute, str]] = {
+    # Can't automatically translate/maintain the upper case abbreviations.
+    DiskAttribute.CRC_ERRORS: "CRC errors",
+    DiskAttribute.UDMA_CRC_ERRORS: "UDMA CRC errors",
+    # "Power_On_Hours" also comes on nvme devices.
+    # Since we decided to display "Powered On", we can't translate this automatically.
+    DiskAttribute.POWER_ON_HOURS: "Powered on",
+}
+
+
+@cache
 def _display_attribute_name(attribute: DiskAttribute) -> str:
-    if (
-        lookup_translation := {
-            # Can't automatically translate/maintain the upper case abbreviations.
-            DiskAttribute.CRC_ERRORS: "CRC errors",
-            DiskAttribute.UDMA_CRC_ERRORS: "UDMA CRC errors",
-            # "Power_On_Hours" also comes on nvme devices.
-            # Since we decided to display "Powered On", we can't translate this automatically.
-            DiskAttribute.POWER_ON_HOURS: "Powered on",
-        }.get(attribute)
-    ) is not None:
+    if (lookup_translation := _DISPLAY_NAME_OVERRIDES.get(attribute)) is not None:
         return lookup_translation
 
     match attribute.name.split("_", maxsplit=1):
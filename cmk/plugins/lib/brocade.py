@@ -3,7 +3,7 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 
 from cmk.agent_based.v2 import all_of, exists, startswith
 
@@ -24,17 +24,23 @@ DISCOVERY_DEFAULT_PARAMETERS = {
 }
 
 
-def brocade_fcport_inventory_this_port(
-    admstate: int,
-    phystate: int,
-    opstate: int,
+def brocade_fcport_inventory_predicate(
     settings: Mapping[str, list[int]],
-) -> bool:
-    if admstate not in settings["admstates"]:
-        return False
-    if phystate not in settings["phystates"]:
-        return False
-    return opstate in settings["opstates"]
+) -> Callable[[int, int, int], bool]:
+    """Create the check whether to discover a port with the given admin, physical and
+    operational state
+
+    The configured states are converted once, so the returned function is cheap to call
+    for every port of the switch.
+    """
+    admstates = frozenset(settings["admstates"])
+    phystates = frozenset(settings["phystates"])
+    opstates = frozenset(settings["opstates"])
+
+    def inventory_this_port(admstate: int, phystate: int, opstate: int) -> bool:
+        return admstate in admstates and phystate in phystates and opstate in opstates
+
+    return inventory_this_port
 
 
 def brocade_fcport_getitem(
@@ -44,9 +50,9 @@ def brocade_fcport_getitem(
     is_isl: bool,
     settings: Mapping[str, bool],
 ) -> str:
-    itemname = ("%0" + str(len(str(number_of_ports))) + "d") % (index - 1)
+    parts = [f"{index - 1:0{len(str(number_of_ports))}d}"]
     if is_isl and settings["show_isl"]:
-        itemname += " ISL"
-    if portname.strip() and settings["use_portname"]:
-        itemname += " " + portname.strip()
-    return itemname
+        parts.append("ISL")
+    if (stripped_portname := portname.strip()) and settings["use_portname"]:
+        parts.append(stripped_portname)
+    return " ".join(parts)
@@ -6,8 +6,10 @@
 
 from __future__ import annotations
 
+import json
 from ast import literal_eval
 from collections.abc import Iterable, Mapping, Sequence
+from functools import cache
 from typing import Any, Final, Literal, Self, TypedDict
 
 from cmk.ccc import store
@@ -29,6 +31,13 @@ class HostLabelValueDict(TypedDict):
     plugin_name: str | None
 
 
+@cache
+def _section_name(raw_name: str) -> SectionName:
+    # There are only few distinct plug-ins discovering host labels, but many labels to load.
+    # Share the (validated) section names instead of creating one per label.
+    return SectionName(raw_name)
+
+
 class _Label:
     """Representing a label in Checkmk"""
 
@@ -55,6 +64,9 @@ class _Label:
             raise TypeError(f"cannot compare {type(self)} to {type(other)}")
         return self.name == other.name and self.value == other.value
 
+    def __hash__(self) -> int:
+        return hash((self.name, self.value))
+
 
 class ServiceLabel(_Label):
     __slots__ = ()
@@ -76,7 +88,7 @@ class HostLabel(_Label):
             plugin_name=(
                 None
                 if (raw_plugin_name := raw.get("plugin_name")) is None
-                else SectionName(raw_plugin_name)
+                else _section_name(raw_plugin_name)
             ),
         )
 
@@ -87,7 +99,7 @@ class HostLabel(_Label):
         assert isinstance(value, str)
 
         raw_name = dict_label["plugin_name"]
-        plugin_name = None if raw_name is None else SectionName(raw_name)
+        plugin_name = None if raw_name is None else _section_name(raw_name)
 
         return cls(name, value, plugin_name)
 
@@ -150,10 +162,23 @@ class HostLabel(_Label):
 
 class LabelsSerializer:
     def serialize(self, data: Mapping[str, HostLabelValueDict]) -> bytes:
-        return repr(data).encode("utf-8")
+        # Leave out missing plugin names instead of writing null: this keeps the file a valid
+        # Python literal, so versions still reading it with literal_eval can load it, too.
+        return json.dumps(
+            {
+                name: {k: v for k, v in label.items() if v is not None}
+                for name, label in data.items()
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
 
     @staticmethod
     def deserialize(raw: bytes) -> Mapping[str, HostLabelValueDict]:
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            # files written as Python literal
+            data = literal_eval(raw.decode("utf-8"))
         # Skip labels discovered by the previous HW/SW Inventory approach
         # (which was addded+removed in 1.6 beta)
         return {
@@ -161,7 +186,7 @@ class LabelsSerializer:
                 "value": str(val["value"]),
                 "plugin_name": str(val["plugin_name"]) if "plugin_name" in val else None,
             }
-            for key, val in literal_eval(raw.decode("utf-8")).items()
+            for key, val in data.items()
             if isinstance(val, dict)
         }
 
@@ -182,7 +207,7 @@ class DiscoveredHostLabelsStore:
             HostLabel(
                 name,
                 raw["value"],
-                None if (raw_name := raw["plugin_name"]) is None else SectionName(raw_name),
+                None if (raw_name := raw["plugin_name"]) is None else _section_name(raw_name),
             )
             for name, raw in self._store.read_obj(default={}).items()
         ]
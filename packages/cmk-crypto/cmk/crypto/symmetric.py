@@ -26,7 +26,7 @@ class TaggedCiphertext:
     tag: bytes
 
 
-def aes_gcm_encrypt(key: bytes, nonce: bytes, plaintext: str) -> TaggedCiphertext:
+def aes_gcm_encrypt(key: bytes, nonce: bytes, plaintext: str | bytes) -> TaggedCiphertext:
     """Symmetrically encrypt a plaintext given a key and a nonce.
 
     AES GCM is an "authenticated encryption with associated data (AEAD)" mode. This means that MAC
@@ -43,13 +43,16 @@ def aes_gcm_encrypt(key: bytes, nonce: bytes, plaintext: str) -> TaggedCiphertex
         Obtain it by generating 16 random bytes and transfer it together with the cipher text. The
         nonce is not secret.
 
-        plaintext: The plaintext to be encrypted.
+        plaintext: The plaintext to be encrypted. Strings are encoded as UTF-8, bytes are
+        encrypted as they are.
 
     Returns:
         The ciphertext and the tag, which is used to authenticate the message. Both values need to
         be transferred and provided to the decryption function in the same order.
     """
-    encrypted = AESGCM(key).encrypt(nonce, plaintext.encode("utf-8"), associated_data=None)
+    if isinstance(plaintext, str):
+        plaintext = plaintext.encode("utf-8")
+    encrypted = AESGCM(key).encrypt(nonce, plaintext, associated_data=None)
     return TaggedCiphertext(
         ciphertext=encrypted[: -TaggedCiphertext.TAG_LENGTH],
         tag=encrypted[-TaggedCiphertext.TAG_LENGTH :],
@@ -62,8 +65,12 @@ def aes_gcm_decrypt(key: bytes, nonce: bytes, ciphertext: TaggedCiphertext) -> s
     This is the inverse method for `aes_gcm_encrypt`. See the docstring of `aes_gcm_encrypt` for
     further information.
     """
-    return (
-        AESGCM(key)
-        .decrypt(nonce, ciphertext.ciphertext + ciphertext.tag, associated_data=None)
-        .decode("utf-8")
-    )
+    return aes_gcm_decrypt_bytes(key, nonce, ciphertext).decode("utf-8")
+
+
+def aes_gcm_decrypt_bytes(key: bytes, nonce: bytes, ciphertext: TaggedCiphertext) -> bytes:
+    """Decrypt a ciphertext given a key and a nonce, without decoding the plaintext.
+
+    See `aes_gcm_decrypt` for the variant returning the plaintext as a string.
+    """
+    return AESGCM(key).decrypt(nonce, ciphertext.ciphertext + ciphertext.tag, associated_data=None)
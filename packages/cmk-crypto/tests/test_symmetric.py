@@ -7,7 +7,12 @@
 import secrets
 from base64 import b64decode
 
-from cmk.crypto.symmetric import aes_gcm_decrypt, aes_gcm_encrypt, TaggedCiphertext
+from cmk.crypto.symmetric import (
+    aes_gcm_decrypt,
+    aes_gcm_decrypt_bytes,
+    aes_gcm_encrypt,
+    TaggedCiphertext,
+)
 
 
 def test_decrypt() -> None:
@@ -28,3 +33,14 @@ def test_roundtrip() -> None:
     assert plain == aes_gcm_decrypt(
         key, nonce, TaggedCiphertext(encrypted.ciphertext, encrypted.tag)
     )
+
+
+def test_roundtrip_bytes() -> None:
+    plain = b"\x00\xff not necessarily valid UTF-8 \xc3"
+    key = secrets.token_bytes(16)
+    nonce = secrets.token_bytes(16)
+
+    encrypted = aes_gcm_encrypt(key, nonce, plain)
+    assert plain == aes_gcm_decrypt_bytes(
+        key, nonce, TaggedCiphertext(encrypted.ciphertext, encrypted.tag)
+    )
@@ -7,9 +7,9 @@
 # pylint: disable=too-many-lines
 
 import argparse
-import ast
 import datetime
 import fcntl
+import json
 import os
 import shlex
 import struct
@@ -19,7 +19,7 @@ import termios
 import time
 import traceback
 import tty
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from functools import cache
 from pathlib import Path
 from typing import Literal, NamedTuple, NoReturn, override
@@ -275,6 +275,7 @@ def werk_path_by_id(werk_id: WerkId) -> Path:
     raise RuntimeError(f"Can not find werk with id={werk_id.id}")
 
 
+@cache
 def get_tty_size() -> tuple[int, int]:
     try:
         ws = bytearray(8)
@@ -322,14 +323,21 @@ def get_config() -> Config:
     return load_config(Path("config"), current_version=current_version)
 
 
-def load_werks() -> dict[WerkId, Werk]:
+@cache
+def load_werks() -> Mapping[WerkId, Werk]:
+    # the werks don't change during the runtime of this script, callers must not modify them
     werks = {}
-    for entry in Path(".").iterdir():
-        if (werk_id := entry.name.removesuffix(".md")).isdigit():
-            try:
-                werks[WerkId(int(werk_id))] = load_werk(entry)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                sys.stderr.write(f"ERROR: Skipping invalid werk {werk_id}: {e}\n")
+    with os.scandir(".") as entries:
+        werk_files = [
+            (werk_id, entry.name)
+            for entry in entries
+            if (werk_id := entry.name.removesuffix(".md")).isdigit()
+        ]
+    for werk_id, file_name in werk_files:
+        try:
+            werks[WerkId(int(werk_id))] = load_werk(Path(file_name))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            sys.stderr.write(f"ERROR: Skipping invalid werk {werk_id}: {e}\n")
     return werks
 
 
@@ -341,17 +349,27 @@ def save_last_werkid(wid: WerkId) -> None:
         pass
 
 
+@cache
+def _git_status_porcelain() -> Sequence[bytes]:
+    # this is read at most once per run: `werk list` & co. only look at it via werk_is_modified
+    # and the commit flows only ask it once via something_in_git_index, after adding the werk
+    status = subprocess.run(
+        ["git", "--no-optional-locks", "status", "--porcelain", "--untracked-files=no"],
+        stdout=subprocess.PIPE,
+        check=False,
+    )
+    return status.stdout.splitlines()
+
+
 @cache
 def git_modified_files() -> set[WerkId]:
-    # this is called from `werk list` via werk_is_modified
-    # so we can assume, that this won't change during runtime of this script
     modified = set()
-    for line in os.popen("git status --porcelain"):
-        if line[0] in "AM" and ".werks/" in line:
+    for line in _git_status_porcelain():
+        if line[:1] in (b"A", b"M") and b".werks/" in line:
             try:
-                wid = line.rsplit("/", 1)[-1].strip()
+                wid = line.rsplit(b"/", 1)[-1].strip().removesuffix(b".md")
                 modified.add(WerkId(int(wid)))
-            except Exception:  # pylint: disable=broad-exception-caught
+            except ValueError:
                 pass
     return modified
 
@@ -398,7 +416,7 @@ def change_werk_version(werk_path: Path, new_version: str, werk_version: WerkVer
 
 
 def git_add(werk: Werk) -> None:
-    os.system(f"git add {werk.path}")  # nosec
+    subprocess.run(["git", "add", str(werk.path)], check=False)
 
 
 def git_move(source: Path, destination: Path) -> None:
@@ -413,6 +431,7 @@ def git_commit(werk: Werk, custom_files: list[str]) -> None:
                 title = f"{prefix} {title}"
 
     title = f"{werk.content.metadata['id'].rjust(5, '0')} {title}"
+    message = title + "\n\n" + werk.content.description
 
     if custom_files:
         files_to_commit = custom_files
@@ -421,36 +440,26 @@ def git_commit(werk: Werk, custom_files: list[str]) -> None:
             files_to_commit.append(f"{git_top_level()}/{entry}")
 
         os.chdir(BASE_DIR)
-        cmd = "git commit {} -m {}".format(
-            " ".join(files_to_commit),
-            shlex.quote(title + "\n\n" + werk.content.description),
-        )
-        os.system(cmd)  # nosec
+        subprocess.run(["git", "commit", *files_to_commit, "-m", message], check=False)
 
     else:
         if something_in_git_index():
-            dash_a = ""
-            os.system(f"cd '{git_top_level()}' ; git add .werks")  # nosec
+            dash_a: list[str] = []
+            subprocess.run(["git", "add", ".werks"], cwd=git_top_level(), check=False)
         else:
-            dash_a = "-a"
+            dash_a = ["-a"]
 
-        cmd = "git commit {} -m {}".format(
-            dash_a,
-            shlex.quote(title + "\n\n" + werk.content.description),
-        )
-        os.system(cmd)  # nosec
+        subprocess.run(["git", "commit", *dash_a, "-m", message], check=False)
 
 
+@cache
 def git_top_level() -> str:
     with subprocess.Popen(["git", "rev-parse", "--show-toplevel"], stdout=subprocess.PIPE) as info:
-        return str(info.communicate()[0].split()[0])
+        return info.communicate()[0].decode("utf-8").strip()
 
 
 def something_in_git_index() -> bool:
-    for line in os.popen("git status --porcelain"):
-        if line[0] == "M":
-            return True
-    return False
+    return any(line[:1] == b"M" for line in _git_status_porcelain())
 
 
 def next_werk_id() -> WerkId:
@@ -470,15 +479,19 @@ def add_comment(werk: Werk, title: str, comment: str) -> None:
 
 
 def list_werk(werk: Werk) -> None:
+    sys.stdout.write(format_werk_line(werk))
+
+
+def format_werk_line(werk: Werk) -> str:
     if werk_is_modified(werk.id):
         bold = TTY_BOLD + TTY_CYAN + "(*) "
     else:
         bold = ""
     _lines, cols = get_tty_size()
     title = werk.content.metadata["title"][: cols - 45]
-    sys.stdout.write(
+    return (
         f"{format_werk_id(werk.id)} "
-        f"{str(werk.date.date()):9} "
+        f"{_format_day(werk.date.date()):9} "
         f"{colored_class(werk.content.metadata['class'], 8)} "
         f"{werk.content.metadata['edition']:3} "
         f"{werk.content.metadata['component']:13} "
@@ -489,14 +502,20 @@ def list_werk(werk: Werk) -> None:
     )
 
 
+@cache
+def _format_day(day: datetime.date) -> str:
+    # many werks share the same day, so listings hit the cache most of the time
+    return str(day)
+
+
 def format_werk_id(werk_id: WerkId) -> str:
-    return TTY_BG_WHITE + TTY_BLUE + f"{werk_id}" + TTY_NORMAL
+    return f"{TTY_BG_WHITE}{TTY_BLUE}{werk_id}{TTY_NORMAL}"
 
 
 def colored_class(classname: str, digits: int) -> str:
     if classname == "fix":
-        return TTY_BOLD + TTY_RED + ("%-" + str(digits) + "s") % classname + TTY_NORMAL
-    return ("%-" + str(digits) + "s") % classname
+        return f"{TTY_BOLD}{TTY_RED}{classname:<{digits}}{TTY_NORMAL}"
+    return f"{classname:<{digits}}"
 
 
 def show_werk(werk: Werk) -> None:
@@ -504,44 +523,46 @@ def show_werk(werk: Werk) -> None:
     sys.stdout.write(f"\n{werk.content.description}\n")
 
 
+def _filter_index(werks: Sequence[Werk]) -> dict[str, tuple[str, str]]:
+    """Map every prefix of every filterable value to the first (type, value) it selects"""
+    versions = sorted({werk.content.metadata["version"] for werk in werks})
+    index: dict[str, tuple[str, str]] = {}
+    for tp, values in [
+        ("edition", get_config().editions),
+        ("component", get_config().all_components()),
+        ("level", get_config().levels),
+        ("class", get_config().classes),
+        ("version", versions),
+        ("compatible", get_config().compatible),
+    ]:
+        for v in values:  # type: ignore[attr-defined] # all of them are iterable.
+            if isinstance(v, tuple):
+                v = v[0]
+            for end in range(len(v) + 1):
+                index.setdefault(v[:end], (tp, v))
+    return index
+
+
 def main_list(args: argparse.Namespace, fmt: str) -> None:  # pylint: disable=too-many-branches
     # arguments are tags from state, component and class. Multiple values
     # in one class are orred. Multiple types are anded.
 
     werks: list[Werk] = list(load_werks().values())
-    versions = sorted({werk.content.metadata["version"] for werk in werks})
 
-    filters: dict[str, list[str]] = {}
+    filters: dict[str, set[str]] = {}
+    filter_index = _filter_index(werks) if args.filter else {}
 
     for a in args.filter:
         if a == "current":
             a = get_config().current_version
 
-        hit = False
-        for tp, values in [
-            ("edition", get_config().editions),
-            ("component", get_config().all_components()),
-            ("level", get_config().levels),
-            ("class", get_config().classes),
-            ("version", versions),
-            ("compatible", get_config().compatible),
-        ]:
-            for v in values:  # type: ignore[attr-defined] # all of them are iterable.
-                if isinstance(v, tuple):
-                    v = v[0]
-                if v.startswith(a):
-                    entries = filters.get(tp, [])
-                    entries.append(v)
-                    filters[tp] = entries
-                    hit = True
-                    break
-            if hit:
-                break
-        if not hit:
+        if (hit := filter_index.get(a)) is None:
             bail_out(
                 f"No such edition, component, state, class, or target version: {a}",
                 0,
             )
+        tp, v = hit
+        filters.setdefault(tp, set()).add(v)
 
     # Filter
     newwerks = []
@@ -558,8 +579,7 @@ def main_list(args: argparse.Namespace, fmt: str) -> None:  # pylint: disable=to
 
     # Output
     if fmt == "console":
-        for werk in werks:
-            list_werk(werk)
+        sys.stdout.write("".join(map(format_werk_line, werks)))
     else:
         output_csv(werks)
 
@@ -567,38 +587,43 @@ def main_list(args: argparse.Namespace, fmt: str) -> None:  # pylint: disable=to
 # CSV Table has the following columns:
 # Component;ID;Title;Class;Effort
 def output_csv(werks: list[Werk]) -> None:
+    lines: list[str] = []
+
     def line(*parts: int | str) -> None:
-        sys.stdout.write('"' + '";"'.join(map(str, parts)) + '"\n')
+        lines.append('"' + '";"'.join(map(str, parts)) + '"\n')
+
+    werks_by_component: dict[str, list[Werk]] = {}
+    for werk in werks:
+        werks_by_component.setdefault(werk.content.metadata["component"], []).append(werk)
 
     nr = 1
     for entry in get_config().components:
         if len(entry) != 2:
             bail_out(f"invalid component {entry!r}")
         name, alias = entry
+        component_werks = werks_by_component.get(name, [])
 
         line("", "", "", "", "")
 
-        total_effort = 0
-        for werk in werks:
-            if werk.content.metadata["component"] == name:
-                total_effort += werk_effort(werk)
+        total_effort = sum(werk_effort(werk) for werk in component_werks)
         line("", f"{nr}. {alias}", "", total_effort)
         nr += 1
 
-        for werk in werks:
-            if werk.content.metadata["component"] == name:
-                line(
-                    werk.content.metadata["id"],
-                    werk.content.metadata["title"],
-                    werk_class(werk),
-                    werk_effort(werk),
-                )
-                line(
-                    "",
-                    werk.content.description.replace("\n", " ").replace('"', "'"),
-                    "",
-                    "",
-                )
+        for werk in component_werks:
+            line(
+                werk.content.metadata["id"],
+                werk.content.metadata["title"],
+                werk_class(werk),
+                werk_effort(werk),
+            )
+            line(
+                "",
+                werk.content.description.replace("\n", " ").replace('"', "'"),
+                "",
+                "",
+            )
+
+    sys.stdout.write("".join(lines))
 
 
 def werk_class(werk: Werk) -> str:
@@ -619,8 +644,10 @@ def werk_effort(werk: Werk) -> int:
 
 def main_show(args: argparse.Namespace) -> None:
     if "all" in args.ids:
-        ids = list(load_werks().keys())
+        werks = load_werks()
+        ids = list(werks.keys())
     else:
+        werks = {}
         ids = [WerkId(id) for id in args.ids] or [get_last_werk()]
 
     for wid in ids:
@@ -628,7 +655,7 @@ def main_show(args: argparse.Namespace) -> None:
             sys.stdout.write(
                 "-------------------------------------------------------------------------------\n"
             )
-        show_werk(load_werk(werk_path_by_id(wid)))
+        show_werk(werks.get(wid) or load_werk(werk_path_by_id(wid)))
     save_last_werkid(ids[-1])
 
 
@@ -758,7 +785,7 @@ def get_werk_arg(arg: WerkId | None) -> WerkId:
 
 def main_blame(args: argparse.Namespace) -> None:
     wid = get_werk_arg(WerkId(args.id))
-    os.system(f"git blame {werk_path_by_id(wid)}")  # nosec
+    subprocess.run(["git", "blame", str(werk_path_by_id(wid))], check=False)
 
 
 def main_url(args: argparse.Namespace) -> None:
@@ -797,7 +824,13 @@ def grep(line: str, kw: str, n: int) -> str | None:
 
 
 def main_grep(args: argparse.Namespace) -> None:
+    keywords_lower = [kw.lower() for kw in args.keywords]
     for werk in load_werks().values():
+        # cheap check first: most werks do not contain all of the keywords
+        haystack = f"{werk.content.metadata['title']}\n{werk.content.description}".lower()
+        if not all(kw in haystack for kw in keywords_lower):
+            continue
+
         one_kw_didnt_match = False
         title = werk.content.metadata["title"]
         lines = werk.content.description.split("\n")
@@ -813,7 +846,6 @@ def main_grep(args: argparse.Namespace) -> None:
             # look for keyword in title
             match = grep(title, kw, i)
             if match:
-                werk.content.metadata["title"] = match
                 title = match
                 this_kw_matched = True
 
@@ -829,7 +861,14 @@ def main_grep(args: argparse.Namespace) -> None:
                 one_kw_didnt_match = True
 
         if not one_kw_didnt_match:
-            list_werk(werk)
+            # don't highlight the title in the (cached) werk itself
+            list_werk(
+                werk._replace(
+                    content=werk.content._replace(
+                        metadata={**werk.content.metadata, "title": title}
+                    )
+                )
+            )
             if args.verbose:
                 for x in sorted(list(bodylines)):
                     sys.stdout.write(f"  {lines[x]}\n")
@@ -862,7 +901,13 @@ def edit_werk(werk_path: Path, custom_files: list[str] | None = None, commit: bo
     werk = None
 
     while True:
-        if os.system(f"bash -c '{editor} +{number_of_lines_in_werk} {werk_path}'") != 0:  # nosec
+        try:
+            returncode = subprocess.run(
+                [*shlex.split(editor), f"+{number_of_lines_in_werk}", str(werk_path)], check=False
+            ).returncode
+        except OSError as e:
+            bail_out(f"Cannot run editor {editor!r}: {e}")
+        if returncode:
             bail_out("Editor returned error, something is very wrong!")
 
         try:
@@ -974,9 +1019,9 @@ def werk_cherry_pick(commit_id: str, no_commit: bool, werk_version: WerkVersion)
 
 def get_werk_ids() -> list[WerkId]:
     try:
+        # a plain list of ints, so files written via repr() by older versions are valid JSON, too
         return [
-            WerkId(i)
-            for i in ast.literal_eval(Path(RESERVED_IDS_FILE_PATH).read_text(encoding="utf-8"))
+            WerkId(i) for i in json.loads(Path(RESERVED_IDS_FILE_PATH).read_text(encoding="utf-8"))
         ]
     except Exception:  # pylint: disable=broad-exception-caught
         return []
@@ -992,16 +1037,27 @@ def invalidate_my_werkid(wid: WerkId) -> None:
 
 def store_werk_ids(ids: list[WerkId]) -> None:
     with open(RESERVED_IDS_FILE_PATH, "w", encoding="utf-8") as f:
-        f.write(repr([i.id for i in ids]) + "\n")
+        f.write(json.dumps([i.id for i in ids]) + "\n")
     sys.stdout.write(f"Werk IDs stored in the file: {RESERVED_IDS_FILE_PATH}\n")
 
 
 def current_branch() -> str:
-    return [line for line in os.popen("git branch") if line.startswith("*")][0].split()[-1]
+    return subprocess.run(
+        ["git", "branch", "--show-current"], capture_output=True, text=True, check=False
+    ).stdout.strip()
 
 
 def current_repo() -> str:
-    return list(os.popen("git config --get remote.origin.url"))[0].strip().split("/")[-1]
+    return (
+        subprocess.run(
+            ["git", "config", "--get", "remote.origin.url"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        .stdout.strip()
+        .split("/")[-1]
+    )
 
 
 def main_fetch_ids(args: argparse.Namespace) -> None:
@@ -1050,7 +1106,12 @@ def main_fetch_ids(args: argparse.Namespace) -> None:
         f"Reserved {args.count} additional IDs now. You have {len(my_ids)} reserved IDs now.\n"
     )
 
-    if os.system(f"git commit -m 'Reserved {args.count} Werk IDS' .") == 0:  # nosec
+    if (
+        subprocess.run(
+            ["git", "commit", "-m", f"Reserved {args.count} Werk IDS", "."], check=False
+        ).returncode
+        == 0
+    ):
         sys.stdout.write("--> Successfully committed reserved werk IDS. Please push it soon!\n")
     else:
         bail_out("Cannot commit.")
@@ -1083,13 +1144,17 @@ def main_preview(args: argparse.Namespace) -> None:
     )
 
 
+@cache
 def get_werk_file_version() -> WerkVersion:
     """
     as long as there is a single markdown file,
     we assume we should create and pick markdown werks.
     """
-    for path in Path(".").iterdir():
-        if path.name.endswith(".md") and path.name.removesuffix(".md").isdigit():
+    with os.scandir(".") as entries:
+        if any(
+            entry.name.endswith(".md") and entry.name.removesuffix(".md").isdigit()
+            for entry in entries
+        ):
             return "v2"
     return "v1"
 
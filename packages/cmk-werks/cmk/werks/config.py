@@ -3,6 +3,8 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import re
+from itertools import chain
 from pathlib import Path
 
 from pydantic import BaseModel, model_validator, ValidationInfo
@@ -19,7 +21,7 @@ class Config(BaseModel):
     current_version: str
 
     def all_components(self) -> list[tuple[str, str]]:
-        return sum(self.edition_components.values(), self.components)
+        return [*self.components, *chain.from_iterable(self.edition_components.values())]
 
     @model_validator(mode="before")
     @classmethod
@@ -41,17 +43,18 @@ class Config(BaseModel):
         raise ValueError("current_version must be provided either directly or via context")
 
 
+_DEFINES_MAKE_VERSION = re.compile(r"^VERSION[^=\n]*=(.*)$", re.MULTILINE)
+
+
 def try_load_current_version_from_defines_make(defines_make: Path) -> str | None:
     try:
-        with defines_make.open(encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("VERSION"):
-                    version = line.split("=", 1)[1].strip()
-                    return version
+        content = defines_make.read_text(encoding="utf-8")
     except FileNotFoundError:
-        pass
+        return None
 
-    return None
+    if (match := _DEFINES_MAKE_VERSION.search(content)) is None:
+        return None
+    return match.group(1).strip()
 
 
 def load_config(werk_config: Path, *, current_version: str | None = None) -> Config:
@@ -102,24 +102,20 @@ def parse_werk_v1(content: str, werk_id: int) -> WerkV1ParseResult:
         "edition": "cre",
         "id": str(werk_id),
     }
-    description = []
-    in_description = False
-    for line in content.split("\n"):
+    lines = content.split("\n")
+    description: list[str] = []
+    for index, line in enumerate(lines):
+        if not line or line.isspace():
+            # the header ends with the first empty line, everything after is the description
+            description = lines[index + 1 :]
+            break
         try:
-            if in_description:
-                description.append(line)
-            elif not line or line.isspace():
-                in_description = True
-            else:
-                key, text = line.split(":", 1)
-                try:
-                    value = str(int(text.strip()))
-                except ValueError:
-                    value = text.strip()
-                field = key.lower()
-                werk[field] = value
-        except Exception as e:
+            key, text = line.split(":", 1)
+        except ValueError as e:
             raise RuntimeError(f"Can not parse line {line!r} of werk {werk_id}") from e
+        value = text.strip()
+        # normalize numbers like "id: 0815"
+        werk[key.lower()] = str(int(value)) if value.isdecimal() else value
 
     while description and description[-1] == "":
         description.pop()
@@ -34,6 +34,10 @@ class TestServiceLabel:
         assert ServiceLabel("a", "b") != ServiceLabel("a", "c")
         assert ServiceLabel("a", "b") != ServiceLabel("c", "b")
 
+    def test_hash(self) -> None:
+        assert hash(ServiceLabel("a", "b")) == hash(ServiceLabel("a", "b"))
+        assert len({ServiceLabel("a", "b"), ServiceLabel("a", "b"), ServiceLabel("a", "c")}) == 2
+
 
 def test_host_labels_to_dict() -> None:
     assert HostLabel("äbc", "123", SectionName("plugin_1")).to_dict() == {
@@ -16,6 +16,8 @@ from tests.testlib.base import Scenario
 
 from cmk.utils.hostaddress import HostName
 
+_MGMT_HOST = HostName("mgmt-host")
+
 
 @pytest.mark.parametrize(
     "protocol,cred_attribute,credentials",
@@ -37,51 +39,45 @@ def test_mgmt_explicit_settings(
     cred_attribute: str,
     credentials: str | Mapping[str, str],
 ) -> None:
-    host = HostName("mgmt-host")
-
     ts = Scenario()
-    ts.add_host(host)
-    ts.set_option("ipaddresses", {host: "127.0.0.1"})
-    ts.set_option("management_protocol", {host: protocol})
-    ts.set_option(cred_attribute, {host: credentials})
+    ts.add_host(_MGMT_HOST)
+    ts.set_option("ipaddresses", {_MGMT_HOST: "127.0.0.1"})
+    ts.set_option("management_protocol", {_MGMT_HOST: protocol})
+    ts.set_option(cred_attribute, {_MGMT_HOST: credentials})
 
     config_cache = ts.apply(monkeypatch)
-    assert config_cache.has_management_board(host)
-    assert config_cache.management_protocol(host) == protocol
-    assert config_cache.management_address(host) == "127.0.0.1"
-    assert config_cache.management_credentials(host, protocol) == credentials
+    assert config_cache.has_management_board(_MGMT_HOST)
+    assert config_cache.management_protocol(_MGMT_HOST) == protocol
+    assert config_cache.management_address(_MGMT_HOST) == "127.0.0.1"
+    assert config_cache.management_credentials(_MGMT_HOST, protocol) == credentials
 
 
 def test_mgmt_explicit_address(monkeypatch: MonkeyPatch) -> None:
-    host = HostName("mgmt-host")
-
     ts = Scenario()
-    ts.add_host(host)
-    ts.set_option("ipaddresses", {host: "127.0.0.1"})
-    ts.set_option("management_protocol", {host: "snmp"})
-    ts.set_option("host_attributes", {host: {"management_address": "127.0.0.2"}})
+    ts.add_host(_MGMT_HOST)
+    ts.set_option("ipaddresses", {_MGMT_HOST: "127.0.0.1"})
+    ts.set_option("management_protocol", {_MGMT_HOST: "snmp"})
+    ts.set_option("host_attributes", {_MGMT_HOST: {"management_address": "127.0.0.2"}})
 
     config_cache = ts.apply(monkeypatch)
-    assert config_cache.has_management_board(host)
-    assert config_cache.management_protocol(host) == "snmp"
-    assert config_cache.management_address(host) == "127.0.0.2"
-    assert config_cache.management_credentials(host, "snmp") == "public"
+    assert config_cache.has_management_board(_MGMT_HOST)
+    assert config_cache.management_protocol(_MGMT_HOST) == "snmp"
+    assert config_cache.management_address(_MGMT_HOST) == "127.0.0.2"
+    assert config_cache.management_credentials(_MGMT_HOST, "snmp") == "public"
 
 
 def test_mgmt_disabled(monkeypatch: MonkeyPatch) -> None:
-    host = HostName("mgmt-host")
-
     ts = Scenario()
-    ts.add_host(host)
-    ts.set_option("ipaddresses", {host: "127.0.0.1"})
-    ts.set_option("management_protocol", {host: None})
-    ts.set_option("host_attributes", {host: {"management_address": "127.0.0.1"}})
-    ts.set_option("management_snmp_credentials", {host: "HOST"})
+    ts.add_host(_MGMT_HOST)
+    ts.set_option("ipaddresses", {_MGMT_HOST: "127.0.0.1"})
+    ts.set_option("management_protocol", {_MGMT_HOST: None})
+    ts.set_option("host_attributes", {_MGMT_HOST: {"management_address": "127.0.0.1"}})
+    ts.set_option("management_snmp_credentials", {_MGMT_HOST: "HOST"})
 
     config_cache = ts.apply(monkeypatch)
-    assert config_cache.has_management_board(host) is False
-    assert config_cache.management_protocol(host) is None
-    assert config_cache.management_address(host) == "127.0.0.1"
+    assert config_cache.has_management_board(_MGMT_HOST) is False
+    assert config_cache.management_protocol(_MGMT_HOST) is None
+    assert config_cache.management_address(_MGMT_HOST) == "127.0.0.1"
 
 
 @pytest.mark.parametrize(
@@ -118,16 +114,15 @@ def test_mgmt_config_ruleset(
         ],
     )
 
-    host = HostName("mgmt-host")
-    ts.add_host(host, host_path="/wato/folder1/hosts.mk")
-    ts.set_option("ipaddresses", {host: "127.0.0.1"})
-    ts.set_option("management_protocol", {host: protocol})
+    ts.add_host(_MGMT_HOST, host_path="/wato/folder1/hosts.mk")
+    ts.set_option("ipaddresses", {_MGMT_HOST: "127.0.0.1"})
+    ts.set_option("management_protocol", {_MGMT_HOST: protocol})
 
     config_cache = ts.apply(monkeypatch)
-    assert config_cache.has_management_board(host)
-    assert config_cache.management_protocol(host) == protocol
-    assert config_cache.management_address(host) == "127.0.0.1"
-    assert config_cache.management_credentials(host, protocol) == ruleset_credentials
+    assert config_cache.has_management_board(_MGMT_HOST)
+    assert config_cache.management_protocol(_MGMT_HOST) == protocol
+    assert config_cache.management_address(_MGMT_HOST) == "127.0.0.1"
+    assert config_cache.management_credentials(_MGMT_HOST, protocol) == ruleset_credentials
 
 
 @pytest.mark.parametrize(
@@ -170,16 +165,15 @@ def test_mgmt_config_ruleset_order(
         ],
     )
 
-    host = HostName("mgmt-host")
-    ts.add_host(host, host_path="/wato/folder1/hosts.mk")
-    ts.set_option("ipaddresses", {host: "127.0.0.1"})
-    ts.set_option("management_protocol", {host: "snmp"})
+    ts.add_host(_MGMT_HOST, host_path="/wato/folder1/hosts.mk")
+    ts.set_option("ipaddresses", {_MGMT_HOST: "127.0.0.1"})
+    ts.set_option("management_protocol", {_MGMT_HOST: "snmp"})
 
     config_cache = ts.apply(monkeypatch)
-    assert config_cache.has_management_board(host)
-    assert config_cache.management_protocol(host) == "snmp"
-    assert config_cache.management_address(host) == "127.0.0.1"
-    assert config_cache.management_credentials(host, "snmp") == "RULESET1"
+    assert config_cache.has_management_board(_MGMT_HOST)
+    assert config_cache.management_protocol(_MGMT_HOST) == "snmp"
+    assert config_cache.management_address(_MGMT_HOST) == "127.0.0.1"
+    assert config_cache.management_credentials(_MGMT_HOST, "snmp") == "RULESET1"
 
 
 @pytest.mark.parametrize(
@@ -216,17 +210,16 @@ def test_mgmt_config_ruleset_overidden_by_explicit_setting(
         ],
     )
 
-    host = HostName("mgmt-host")
-    ts.add_host(host, host_path="/wato/folder1/hosts.mk")
-    ts.set_option("ipaddresses", {host: "127.0.0.1"})
-    ts.set_option("management_protocol", {host: protocol})
-    ts.set_option(cred_attribute, {host: host_credentials})
+    ts.add_host(_MGMT_HOST, host_path="/wato/folder1/hosts.mk")
+    ts.set_option("ipaddresses", {_MGMT_HOST: "127.0.0.1"})
+    ts.set_option("management_protocol", {_MGMT_HOST: protocol})
+    ts.set_option(cred_attribute, {_MGMT_HOST: host_credentials})
 
     config_cache = ts.apply(monkeypatch)
-    assert config_cache.has_management_board(host)
-    assert config_cache.management_protocol(host) == protocol
-    assert config_cache.management_address(host) == "127.0.0.1"
-    assert config_cache.management_credentials(host, protocol) == host_credentials
+    assert config_cache.has_management_board(_MGMT_HOST)
+    assert config_cache.management_protocol(_MGMT_HOST) == protocol
+    assert config_cache.management_address(_MGMT_HOST) == "127.0.0.1"
+    assert config_cache.management_credentials(_MGMT_HOST, protocol) == host_credentials
 
 
 @pytest.mark.parametrize(
@@ -242,6 +235,7 @@ def test_mgmt_config_ruleset_overidden_by_explicit_setting(
             },
         ),
     ],
+    ids=["snmp", "ipmi"],
 )
 @pytest.mark.parametrize(
     "tags, host_attributes, ipaddresses, ipv6addresses, ip_address_result",
@@ -431,18 +425,16 @@ def test_mgmt_board_ip_addresses(
     ipv6addresses,
     ip_address_result,
 ):
-    hostname = HostName("mgmt-host")
-
     ts = Scenario()
-    ts.add_host(hostname, tags=tags)
-    ts.set_option("host_attributes", {hostname: host_attributes})
+    ts.add_host(_MGMT_HOST, tags=tags)
+    ts.set_option("host_attributes", {_MGMT_HOST: host_attributes})
     ts.set_option("ipaddresses", ipaddresses)
     ts.set_option("ipv6addresses", ipv6addresses)
-    ts.set_option("management_protocol", {hostname: protocol})
-    ts.set_option(cred_attribute, {hostname: credentials})
+    ts.set_option("management_protocol", {_MGMT_HOST: protocol})
+    ts.set_option(cred_attribute, {_MGMT_HOST: credentials})
 
     config_cache = ts.apply(monkeypatch)
-    assert config_cache.has_management_board(hostname)
-    assert config_cache.management_protocol(hostname) == protocol
-    assert config_cache.management_address(hostname) == ip_address_result
-    assert config_cache.management_credentials(hostname, protocol) == credentials
+    assert config_cache.has_management_board(_MGMT_HOST)
+    assert config_cache.management_protocol(_MGMT_HOST) == protocol
+    assert config_cache.management_address(_MGMT_HOST) == ip_address_result
+    assert config_cache.management_credentials(_MGMT_HOST, protocol) == credentials
@@ -14,3 +14,8 @@ from cmk.crypto.secrets import Secret
 def test_value_encrypter_transparent(mocker: MockerFixture) -> None:
     mocker.patch("cmk.gui.utils.encrypter.Encrypter._get_secret", return_value=Secret(b"A" * 32))
     assert Encrypter.decrypt(Encrypter.encrypt(data := "abc")) == data
+
+
+def test_value_encrypter_transparent_bytes(mocker: MockerFixture) -> None:
+    mocker.patch("cmk.gui.utils.encrypter.Encrypter._get_secret", return_value=Secret(b"A" * 32))
+    assert Encrypter.decrypt_bytes(Encrypter.encrypt(data := b"\x00\xffabc")) == data
@@ -16,6 +16,10 @@ from .utils import (
 Seconds = int
 
 
+def _identity(value: str) -> str:
+    return value
+
+
 @pytest.fixture(name="transformed_age")
 def fixture_transformed_age() -> vs.Transform[Seconds]:
     return vs.Transform(
@@ -31,16 +35,16 @@ class TestTransform:
         assert (
             vs.Transform(
                 vs.TextInput(allow_empty=False),
-                to_valuespec=lambda v: v,
-                from_valuespec=lambda v: v,
+                to_valuespec=_identity,
+                from_valuespec=_identity,
             ).allow_empty()
             is False
         )
         assert (
             vs.Transform(
                 vs.TextInput(allow_empty=True),
-                to_valuespec=lambda v: v,
-                from_valuespec=lambda v: v,
+                to_valuespec=_identity,
+                from_valuespec=_identity,
             ).allow_empty()
             is True
         )
@@ -49,16 +53,16 @@ class TestTransform:
         assert (
             vs.Transform(
                 vs.TextInput(title="text_input_title"),
-                to_valuespec=lambda v: v,
-                from_valuespec=lambda v: v,
+                to_valuespec=_identity,
+                from_valuespec=_identity,
             ).title()
             == "text_input_title"
         )
         assert (
             vs.Transform(
                 vs.TextInput(title="text_input_title"),
-                to_valuespec=lambda v: v,
-                from_valuespec=lambda v: v,
+                to_valuespec=_identity,
+                from_valuespec=_identity,
                 title="transform_title",
             ).title()
             == "transform_title"
@@ -68,16 +72,16 @@ class TestTransform:
         assert (
             vs.Transform(
                 vs.TextInput(help="text_input_help"),
-                to_valuespec=lambda v: v,
-                from_valuespec=lambda v: v,
+                to_valuespec=_identity,
+                from_valuespec=_identity,
             ).help()
             == "text_input_help"
         )
         assert (
             vs.Transform(
                 vs.TextInput(help="text_input_help"),
-                to_valuespec=lambda v: v,
-                from_valuespec=lambda v: v,
+                to_valuespec=_identity,
+                from_valuespec=_identity,
                 help="transform_help",
             ).help()
             == "transform_help"
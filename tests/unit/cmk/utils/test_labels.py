@@ -3,6 +3,7 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+from ast import literal_eval
 from pathlib import Path
 
 import pytest
@@ -10,7 +11,8 @@ from pytest import MonkeyPatch
 
 import cmk.utils.paths
 from cmk.utils.hostaddress import HostName
-from cmk.utils.labels import DiscoveredHostLabelsStore
+from cmk.utils.labels import DiscoveredHostLabelsStore, HostLabel
+from cmk.utils.sectionname import SectionName
 
 
 @pytest.fixture(name="discovered_host_labels_dir")
@@ -31,3 +33,33 @@ def test_discovered_host_labels_store_load_default(discovered_host_labels_dir: P
     store = DiscoveredHostLabelsStore(HostName("host"))
     assert not store.file_path.exists()
     assert not store.load()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param("{'äbc': {'value': '123', 'plugin_name': 'plugin_1'}}\n", id="python"),
+        pytest.param('{"äbc": {"value": "123", "plugin_name": "plugin_1"}}\n', id="json"),
+    ],
+)
+def test_discovered_host_labels_store_load_formats(
+    discovered_host_labels_dir: Path, content: str
+) -> None:
+    store = DiscoveredHostLabelsStore(HostName("host"))
+    store.file_path.parent.mkdir(parents=True)
+    store.file_path.write_text(content, encoding="utf-8")
+    assert store.load() == [HostLabel("äbc", "123", SectionName("plugin_1"))]
+
+
+def test_discovered_host_labels_store_save_python_literal(
+    discovered_host_labels_dir: Path,
+) -> None:
+    store = DiscoveredHostLabelsStore(HostName("host"))
+    labels = [HostLabel("äbc", "123", SectionName("plugin_1")), HostLabel("xyz", "äbc", None)]
+    store.save(labels)
+    assert store.load() == labels
+    # older versions read the file with literal_eval
+    assert literal_eval(store.file_path.read_text(encoding="utf-8")) == {
+        "äbc": {"value": "123", "plugin_name": "plugin_1"},
+        "xyz": {"value": "äbc"},
+    }